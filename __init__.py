@@ -16,76 +16,150 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import bpy
-from . import properties
-from . import operators
-from . import ui
-
 bl_info = {
     "name": "Kitten export",
-    "blender": (4, 50, 0),
+    "version": (0, 0, 2),
+    "blender": (4, 2, 0),
     "category": "Import-Export",
 }
 
-classes = (
-    properties.ThrusterProperties,
-    properties.EngineProperties,
-    operators.OBJECT_OT_add_thruster,
-    operators.OBJECT_OT_add_engine,
-    operators.OBJECT_OT_place_at_selection,
-    ui.OBJECT_PT_thruster_panel,
-    ui.OBJECT_PT_engine_panel,
-    operators.OBJECT_OT_export_ksa_metadata,
-    operators.OBJECT_OT_export_glb_with_meta,
-    operators.OBJECT_OT_export_thrusters_OLD,
-    operators.OBJECT_OT_bake_thruster_meta,
-    operators.OBJECT_OT_export_engines,
-    operators.OBJECT_OT_bake_engine_meta,
-    ui.VIEW3D_MT_ksa_add,
-)
+import importlib
+import logging
+from contextlib import suppress
 
-def register():
-    for cls in classes:
-        try:
-            bpy.utils.register_class(cls)
-        except Exception:
-            pass
+import bpy
+
+log = logging.getLogger(__name__)
+
+# Submodules are imported on first register() rather than at package import,
+# so merely loading the package does not pull in any props/operator/UI code.
+# On "Reload Scripts" Blender re-executes this module with its old globals
+# still present; remember that so the submodules get reloaded too.
+_reloading = "properties" in locals()
+properties = None
+operators = None
+ui = None
+_classes = None
+_register_classes = None
+_unregister_classes = None
+_pointer_props = None
+
+def _lazy(name):
+    """Import and return the package submodule ``name``, reloading it after a script reload."""
+    module = importlib.import_module("." + name, __name__)
+    if _reloading:
+        module = importlib.reload(module)
+    return module
+
+def _load_submodules():
+    global properties, operators, ui, _reloading
+    if properties is not None:
+        return
+    if _reloading:
+        # operators binds names from utils at import time, so refresh it first
+        _lazy("utils")
+    properties = _lazy("properties")
+    operators = _lazy("operators")
+    ui = _lazy("ui")
+    _reloading = False
+
+def _get_classes():
+    """Return the classes to register, building the tuple on first call.
+
+    The result is cached so repeated register/unregister cycles reuse it.
+    """
+    global _classes
+    if _classes is None:
+        _load_submodules()
+        _classes = (
+            properties.ThrusterProperties,
+            properties.EngineProperties,
+            operators.OBJECT_OT_add_thruster,
+            operators.OBJECT_OT_add_engine,
+            operators.OBJECT_OT_place_at_selection,
+            ui.OBJECT_PT_thruster_panel,
+            ui.OBJECT_PT_engine_panel,
+            operators.OBJECT_OT_export_ksa_metadata,
+            operators.OBJECT_OT_export_glb_with_meta,
+            operators.OBJECT_OT_export_thrusters_OLD,
+            operators.OBJECT_OT_bake_thruster_meta,
+            operators.OBJECT_OT_export_engines,
+            operators.OBJECT_OT_bake_engine_meta,
+            ui.VIEW3D_MT_ksa_add,
+        )
+    return _classes
+
+def _get_pointer_props():
+    """Return the ``Object`` pointer properties, creating them once."""
+    global _pointer_props
+    if _pointer_props is None:
+        _pointer_props = {
+            "thruster_props": bpy.props.PointerProperty(type=properties.ThrusterProperties),
+            "engine_props": bpy.props.PointerProperty(type=properties.EngineProperties),
+        }
+    return _pointer_props
+
+def _menu_hooks():
+    return (
+        (bpy.types.VIEW3D_MT_add, ui.menu_func),
+        (bpy.types.VIEW3D_MT_mesh_add, ui.menu_func),
+        (bpy.types.TOPBAR_MT_file_export, ui.export_menu_func),
+    )
 
+def _attach_menus():
+    """One-shot timer callback: hook our entries into Blender's menus."""
     try:
-        bpy.types.Object.thruster_props = bpy.props.PointerProperty(type=properties.ThrusterProperties)
-        bpy.types.Object.engine_props = bpy.props.PointerProperty(type=properties.EngineProperties)
+        for menu, func in _menu_hooks():
+            menu.append(func)
     except Exception:
         pass
+    return None
+
+def register():
+    global _register_classes, _unregister_classes
+    if _register_classes is None:
+        _register_classes, _unregister_classes = bpy.utils.register_classes_factory(_get_classes())
+    try:
+        _register_classes()
+    except Exception as e:
+        log.error("Kitten export: class registration failed: %s", e)
 
     try:
-        bpy.types.VIEW3D_MT_add.append(ui.menu_func)
-        bpy.types.VIEW3D_MT_mesh_add.append(ui.menu_func)
-        bpy.types.TOPBAR_MT_file_export.append(ui.export_menu_func)
+        for name, prop in _get_pointer_props().items():
+            setattr(bpy.types.Object, name, prop)
     except Exception:
         pass
 
-    print("Kitten export addon registered")
+    # Menus are only needed once the UI draws, so attach them off the startup
+    # path. Persistent so loading a .blend right after startup keeps the timer.
+    bpy.app.timers.register(_attach_menus, first_interval=0.1, persistent=True)
+
+    if bpy.app.debug_value:
+        print("Kitten export addon registered")
 
 def unregister():
-    try:
-        bpy.types.VIEW3D_MT_add.remove(ui.menu_func)
-        bpy.types.TOPBAR_MT_file_export.remove(ui.export_menu_func)
-    except Exception:
-        pass
+    if _register_classes is None:
+        return
 
-    try:
-        del bpy.types.Object.thruster_props
-        del bpy.types.Object.engine_props
-    except Exception:
-        pass
+    if bpy.app.timers.is_registered(_attach_menus):
+        bpy.app.timers.unregister(_attach_menus)
+    else:
+        with suppress(ValueError, AttributeError):
+            for menu, func in _menu_hooks():
+                menu.remove(func)
+
+    if _pointer_props:
+        for name in _pointer_props:
+            with suppress(AttributeError):
+                delattr(bpy.types.Object, name)
 
-    for cls in reversed(classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except Exception:
-            pass
+    try:
+        _unregister_classes()
+    except Exception as e:
+        log.error("Kitten export: class unregistration failed: %s", e)
 
-    print("Kitten export addon unregistered")
+    if bpy.app.debug_value:
+        print("Kitten export addon unregistered")
 
 if __name__ == "__main__":
     register()
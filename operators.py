@@ -1,15 +1,98 @@
 import bpy
-import bmesh
+import logging
+from contextlib import contextmanager, suppress
 import math
 import mathutils
 import os
-import xml.etree.ElementTree as ET
+import shutil
+import numpy as np
 from .utils import (
-    _safe_vector_to_list, _thruster_dict_to_xml_element, _engine_dict_to_xml_element,
-    thrusters_list_to_xml_str, engines_list_to_xml_str, meta_dict_to_xml_str,
-    parse_meta_string, sanitize_filename, _extract_material_maps, _indent_xml
+    ET, meta_dict_to_xml_str,
+    write_thrusters_xml, write_engines_xml, meta_list_to_json_bytes,
+    thrusters_list_to_binary_bytes, _xml_bytes,
+    add_blocks_placeholder, write_spliced_blocks,
+    thruster_directions_from_rotations, engine_directions_from_rotations,
+    parse_meta_string_typed, META_DICT, META_LIST, sanitize_filename, xml_export_path, atomic_open, _extract_material_maps
 )
 
+log = logging.getLogger(__name__)
+
+# Default Y rotation for new thrusters/engines
+_NEG_HALF_PI = -math.pi / 2
+
+def _print_export_summary(kind, data, limit=10):
+    """Console fallback of the export operators: entry count and the first names."""
+    names = ', '.join(entry['name'] for entry in data[:limit])
+    more = f" (+{len(data) - limit} more)" if len(data) > limit else ""
+    print(f"{kind} export: {len(data)} entries: {names}{more}")
+
+def _foreach_array(objects, attr):
+    """Read a 3-float property of every object in ``objects`` with one foreach_get,
+    as an (N, 3) float32 array in collection order."""
+    flat = np.empty(len(objects) * 3, dtype=np.float32)
+    objects.foreach_get(attr, flat)
+    return flat.reshape(-1, 3)
+
+def _foreach_rows(objects, attr):
+    """Like _foreach_array, returned as a list of [x, y, z] lists."""
+    return _foreach_array(objects, attr).tolist()
+
+def _thruster_entry(name, tp, location, **extra):
+    """Metadata dict of one thruster from its ThrusterProperties ``tp``.
+
+    The key order is the one the bake and GLB metadata writers emit; ``extra``
+    keys follow. [:] copies the Blender arrays into tuples in one C call.
+    """
+    return {
+        'name': name,
+        'thrust_n': tp.thrust_n,
+        'specific_impulse_seconds': tp.specific_impulse_seconds,
+        'minimum_pulse_time_seconds': tp.minimum_pulse_time_seconds,
+        'volumetric_exhaust_id': tp.volumetric_exhaust_id,
+        'sound_event_on': tp.sound_event_on,
+        'control_map_translation': tp.control_map_translation[:],
+        'control_map_rotation': tp.control_map_rotation[:],
+        'exportable': tp.exportable,
+        'location': location,
+        **extra,
+    }
+
+def _engine_entry(name, ep, location, **extra):
+    """Metadata dict of one engine from its EngineProperties ``ep``, ordered like _thruster_entry."""
+    return {
+        'name': name,
+        'thrust_kn': ep.thrust_kn,
+        'specific_impulse_seconds': ep.specific_impulse_seconds,
+        'minimum_throttle': ep.minimum_throttle,
+        'volumetric_exhaust_id': ep.volumetric_exhaust_id,
+        'sound_event_action_on': ep.sound_event_action_on,
+        'exportable': ep.exportable,
+        'location': location,
+        **extra,
+    }
+
+@contextmanager
+def _temporarily_hidden(objects):
+    """Hide ``objects`` in the viewport for the duration of the block.
+
+    Each flag is set through the property so its RNA update runs and the view
+    layer sees the change; foreach_set would only write the raw flag. Objects
+    whose flag cannot be changed (e.g. linked data) are skipped, and every
+    object that was changed is restored even if another restore fails.
+    """
+    prev_hidden = []
+    try:
+        for o in objects:
+            with suppress(AttributeError, RuntimeError):
+                hidden = o.hide_viewport
+                o.hide_viewport = True
+                prev_hidden.append((o, hidden))
+        yield
+    finally:
+        for o, hidden in prev_hidden:
+            with suppress(AttributeError, RuntimeError):
+                o.hide_viewport = hidden
+
 class OBJECT_OT_place_at_selection(bpy.types.Operator):
     bl_idname = "object.place_at_selection"
     bl_label = "Place KSA Object at Selection"
@@ -40,89 +123,73 @@ class OBJECT_OT_place_at_selection(bpy.types.Operator):
 
     def execute(self, context):
         obj = context.object
-        mw = obj.matrix_world
         mesh = obj.data
         
         # 1. Get Geometry from Edit Mode
-        bm = bmesh.from_edit_mesh(mesh)
-        selected_verts = [v for v in bm.verts if v.select]
+        # Sync the edit-mesh into mesh.vertices so selection and coordinates can be
+        # read with one foreach_get each instead of a Python loop over every vertex
+        obj.update_from_editmode()
+        vert_count = len(mesh.vertices)
+        selected = np.zeros(vert_count, dtype=bool)
+        mesh.vertices.foreach_get('select', selected)
+        selected_idx = np.flatnonzero(selected)
 
         # 2. Validation
-        if len(selected_verts) < 3:
+        if len(selected_idx) < 3:
             self.report({'ERROR'}, "Select at least 3 vertices to define a plane/ring.")
             return {'CANCELLED'}
 
         # 3. Calculate Center and Normal
-        world_coords = [mw @ v.co for v in selected_verts]
+        co = np.empty(vert_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', co)
+        mw = np.array(obj.matrix_world, dtype=np.float64)
+        world_coords = co.reshape(-1, 3)[selected_idx] @ mw[:3, :3].T + mw[:3, 3]
         
         # Center is the average position
-        center = sum(world_coords, mathutils.Vector()) / len(world_coords)
+        center = world_coords.mean(axis=0)
+        offsets = world_coords - center
         
-        # Calculate normal using Blender's internal robust method
-        normal = mathutils.geometry.normal(world_coords)
+        # Newell's method over the selection in index order, as mathutils.geometry.normal does
+        normal = np.cross(offsets, np.roll(offsets, -1, axis=0)).sum(axis=0)
+        length = np.sqrt(normal @ normal)
+        if length > 1e-12:
+            normal /= length
+        else:
+            # Let Blender's robust method decide on (near) degenerate input
+            normal = np.array(mathutils.geometry.normal([mathutils.Vector(p) for p in world_coords.tolist()]))
         
         # Fallback for degenerate geometry (collinear points)
-        if normal.length_squared < 1e-6:
+        if normal @ normal < 1e-6:
             self.report({'ERROR'}, "Selection is collinear or degenerate; cannot calculate normal.")
             return {'CANCELLED'}
             
         # Check planarity (Standard Deviation of distance to plane)
         # Plane equation: normal . (p - center) = 0
-        distances = [abs(normal.dot(p - center)) for p in world_coords]
-        avg_deviation = sum(distances) / len(distances)
+        avg_deviation = float(np.abs(offsets @ normal).mean())
         
         if avg_deviation > 0.1: # Threshold in meters (adjust as needed)
             self.report({'WARNING'}, f"Selection is not planar (Avg Dev: {avg_deviation:.3f}m). Result might be inaccurate.")
 
+        center = mathutils.Vector(center.tolist())
+        normal = mathutils.Vector(normal.tolist())
         normal = -normal
 
         # 4. Switch to Object Mode to add the new object
         bpy.ops.object.mode_set(mode='OBJECT')
 
-        # 5. Add the specific object type
-        if self.type == 'THRUSTER':
-            bpy.ops.object.add_thruster()
-        else:
-            bpy.ops.object.add_engine()
-            
-        new_obj = context.active_object
+        # 5. Add the specific object type (directly, without an operator dispatch
+        # and its extra undo push)
+        new_obj = _make_thruster(context) if self.type == 'THRUSTER' else _make_engine(context)
+        _select_only(context, new_obj)
         
         # 6. Apply Transform
-        new_obj.location = center
-        
         # We want the object's local X axis (Exhaust) to point along the Normal.
         # 'Z' is the "Up" axis which we don't care about as much, but we need it stable.
-        
-        # Method: Construct a rotation matrix directly from the normal
-        # If the normal is (0,0,1), we want local X to be (0,0,1).
-        
-        # Create a rotation that aligns the TRACK axis (X) to the vector (normal)
-        rot_quat = normal.to_track_quat('X', 'Z')
-        
-        # If the previous code resulted in it lying flat, it means the object's 
-        # internal geometry might be oriented along Z or Y, but we are aligning X.
-        # However, assuming your Thruster empty is an arrow pointing +X or +Z:
-        
-        # FIX: If the object looks "aligned with the plane", it usually means 
-        # we aligned the wrong local axis to the normal.
-        
-        # Let's try aligning the object's Z axis to the normal instead, 
-        # or forcing the alignment more explicitly.
-        
-        # If your thruster visual (Arrow) points up (Z), use 'Z'.
-        # If your thruster visual (Arrow) points forward (X), use 'X'.
-        
-        # Assuming your Empty displays as an Arrow pointing +Z (Blender default):
-        # transform so Local Z matches Normal.
-        
-        # Re-evaluating based on your comment: 
-        # "Aligned with vertices plane" means it is 90 degrees off.
-        # If you used 'X' before and it laid flat, maybe the visual arrow is Z?
-        
-        # Let's align the Z-axis to the normal (Standard Blender "Up").
-        rot_quat = normal.to_track_quat('Z', 'X')
-        
-        new_obj.rotation_euler = rot_quat.to_euler()
+        # Tracking X laid the object flat in the plane, so align the Empty's local Z
+        # (Blender's default arrow axis) to the normal instead. Location and rotation
+        # go in with one matrix assignment rather than via a quaternion-to-Euler round trip.
+        new_obj.matrix_world = (mathutils.Matrix.Translation(center)
+                                @ normal.to_track_quat('Z', 'X').to_matrix().to_4x4())
 
         self.report({'INFO'}, f"Placed {self.type} at selection center.")
         return {'FINISHED'}
@@ -171,55 +238,52 @@ class OBJECT_OT_export_ksa_metadata(bpy.types.Operator):
             self.report({'ERROR'}, "No scene found")
             return {'CANCELLED'}
 
-        # Collect thrusters
+        # Collect thrusters, engines and exportable meshes in a single pass over the scene
         thrusters = []
-        for obj in scene.objects:
-            if obj.get('_is_thruster') is None and not obj.name.startswith('Thruster'):
-                continue
-            tp = getattr(obj, 'thruster_props', None)
-            if tp is None or not getattr(tp, 'exportable', False):
-                continue
-
-            entry = {
-                'name': obj.name,
-                'location': list(obj.location) if obj.location is not None else None,
-                'rotation': list(obj.rotation_euler) if obj.rotation_euler is not None else None,
-                'fx_location': _safe_vector_to_list(tp.fx_location),
-                'thrust_n': tp.thrust_n,
-                'specific_impulse_seconds': tp.specific_impulse_seconds,
-                'minimum_pulse_time_seconds': tp.minimum_pulse_time_seconds,
-                'volumetric_exhaust_id': tp.volumetric_exhaust_id,
-                'sound_event_on': tp.sound_event_on,
-                'control_map_translation': _safe_vector_to_list(tp.control_map_translation),
-                'control_map_rotation': _safe_vector_to_list(tp.control_map_rotation),
-                'exportable': tp.exportable,
-            }
-            thrusters.append(entry)
-
-        # Collect engines
         engines = []
-        for obj in scene.objects:
-            if obj.get('_is_engine') is None and not obj.name.startswith('Engine'):
-                continue
-            ep = getattr(obj, 'engine_props', None)
-            if ep is None or not getattr(ep, 'exportable', False):
-                continue
-
-            entry = {
-                'name': obj.name,
-                'location': list(obj.location) if obj.location is not None else None,
-                'rotation': list(obj.rotation_euler) if obj.rotation_euler is not None else None,
-                'thrust_kn': ep.thrust_kn,
-                'specific_impulse_seconds': ep.specific_impulse_seconds,
-                'minimum_throttle': ep.minimum_throttle,
-                'volumetric_exhaust_id': ep.volumetric_exhaust_id,
-                'sound_event_action_on': ep.sound_event_action_on,
-                'exportable': ep.exportable,
-            }
-            engines.append(entry)
+        mesh_objects = []
+        # Bound appends: saves an attribute lookup per object in the loop below
+        add_thruster = thrusters.append
+        add_engine = engines.append
+        add_mesh = mesh_objects.append
+        objects = scene.objects
+        # Snapshot every object's location/rotation with one foreach_get each. The
+        # rotations stay columnar: the exhaust directions are computed from the
+        # rows of the exported objects, so the dicts do not carry them.
+        loc_rows = _foreach_rows(objects, 'location')
+        rotations = _foreach_array(objects, 'rotation_euler')
+        thruster_rows = []
+        engine_rows = []
+        for i, obj in enumerate(objects):
+            name = obj.name
+            # One RNA call for all custom-property tags instead of a get() per tag
+            keys = obj.keys()
+            is_thruster = '_is_thruster' in keys
+            is_engine = '_is_engine' in keys
+
+            if is_thruster or name.startswith('Thruster'):
+                # thruster_props/engine_props are registered on every Object
+                tp = obj.thruster_props
+                if tp.exportable:
+                    thruster_rows.append(i)
+                    add_thruster(_thruster_entry(name, tp, loc_rows[i],
+                                                 fx_location=tp.fx_location[:]))
+
+            if is_engine or name.startswith('Engine'):
+                ep = obj.engine_props
+                if ep.exportable:
+                    engine_rows.append(i)
+                    add_engine(_engine_entry(name, ep, loc_rows[i]))
+
+            # Mesh objects (exclude thrusters/engines/_no_export). Each tag excludes only
+            # when truthy; its value is read only if the key exists.
+            if getattr(obj, 'type', '') == 'MESH' and not (
+                    (is_thruster and obj.get('_is_thruster'))
+                    or (is_engine and obj.get('_is_engine'))
+                    or ('_no_export' in keys and obj.get('_no_export'))):
+                add_mesh(obj)
 
         # Determine base directory
-        import os
         base_dir = self.filepath if os.path.isdir(self.filepath) else (os.path.dirname(self.filepath) if self.filepath else os.getcwd())
         if not base_dir:
             base_dir = os.getcwd()
@@ -239,15 +303,6 @@ class OBJECT_OT_export_ksa_metadata(bpy.types.Operator):
         except Exception:
             textures_dir = None
 
-        # Collect mesh objects (exclude thrusters/engines/_no_export)
-        mesh_objects = []
-        for obj in scene.objects:
-            if getattr(obj, 'type', '') != 'MESH':
-                continue
-            if obj.get('_no_export') or obj.get('_is_thruster') or obj.get('_is_engine'):
-                continue
-            mesh_objects.append(obj)
-
         # Unique filenames for meshes
         used_names = set()
         mesh_export_info = []  # (obj, glb_path, mesh_id)
@@ -265,15 +320,19 @@ class OBJECT_OT_export_ksa_metadata(bpy.types.Operator):
             mesh_export_info.append((obj, glb_path, mesh_file_name, mesh_id))
 
         # Preserve selection
-        prev_selected = [o for o in getattr(context, 'selected_objects', [])]
+        prev_selected = list(getattr(context, 'selected_objects', []))
         prev_active = getattr(context.view_layer.objects, 'active', None)
 
-        exported_mesh_count = 0
-        for obj, path, _, _ in mesh_export_info:
+        # Object has no 'select' RNA property for foreach_set, and select_all is a
+        # full operator call; toggle only the objects involved instead.
+        for o in prev_selected:
             try:
-                bpy.ops.object.select_all(action='DESELECT')
+                o.select_set(False)
             except Exception:
                 pass
+
+        exported_mesh_count = 0
+        for obj, path, _, _ in mesh_export_info:
             try:
                 obj.select_set(True)
                 context.view_layer.objects.active = obj
@@ -283,13 +342,13 @@ class OBJECT_OT_export_ksa_metadata(bpy.types.Operator):
                 bpy.ops.export_scene.gltf(filepath=path, export_format='GLB', use_selection=True)
                 exported_mesh_count += 1
             except Exception:
-                continue
+                pass
+            try:
+                obj.select_set(False)
+            except Exception:
+                pass
 
         # Restore selection
-        try:
-            bpy.ops.object.select_all(action='DESELECT')
-        except Exception:
-            pass
         for o in prev_selected:
             try:
                 o.select_set(True)
@@ -335,7 +394,6 @@ class OBJECT_OT_export_ksa_metadata(bpy.types.Operator):
                             saved = True
                         elif hasattr(img, 'save'):  # try original or direct save
                             if hasattr(img, 'filepath_raw') and img.filepath_raw and os.path.exists(img.filepath_raw):
-                                import shutil
                                 shutil.copy2(img.filepath_raw, out_path)
                                 saved = True
                             if not saved:
@@ -347,7 +405,6 @@ class OBJECT_OT_export_ksa_metadata(bpy.types.Operator):
                         try:
                             src_fallback = getattr(img, 'filepath', '') or getattr(img, 'filepath_raw', '')
                             if src_fallback and os.path.exists(src_fallback):
-                                import shutil
                                 shutil.copy2(src_fallback, out_path)
                                 saved = True
                         except Exception:
@@ -400,22 +457,21 @@ class OBJECT_OT_export_ksa_metadata(bpy.types.Operator):
                 mat_id = f"{sanitize_filename(first_mat.name)}TextureFile"
                 ET.SubElement(sp_model, 'Material', Id=mat_id)
 
-        # Add thruster subparts
-        for thruster_data in thrusters:
-            # Previously each thruster was wrapped in a SubPart; now we place it directly under Part.
-            _thruster_dict_to_xml_element(part_elem, thruster_data)
-        # Add engines directly under Part (no SubPart wrapper)
-        for engine_data in engines:
-            _engine_dict_to_xml_element(part_elem, engine_data)
-
-        # Serialize XML (pretty + CRLF)
-        _indent_xml(root)
-        xml_text = ET.tostring(root, encoding='utf-8').decode('utf-8').replace('\n', '\r\n')
+        # Thrusters and engines go directly under Part (no SubPart wrapper). Their
+        # blocks are emitted as text and spliced in after the tree is serialized.
+        if thrusters or engines:
+            add_blocks_placeholder(part_elem)
+
+        # Serialize XML (pretty + CRLF); the small tree is serialized once and the
+        # thruster/engine blocks are streamed into it while writing
+        xml_bytes = _xml_bytes(root)
+        thruster_dirs = thruster_directions_from_rotations(rotations[thruster_rows])
+        engine_dirs = engine_directions_from_rotations(rotations[engine_rows])
         xml_out_path = os.path.join(base_dir, 'part.xml')
         try:
-            with open(xml_out_path, 'w', encoding='utf-8') as f:
-                f.write('<?xml version="1.0" encoding="utf-8"?>\r\n')
-                f.write(xml_text)
+            with atomic_open(xml_out_path) as f:
+                write_spliced_blocks(f, xml_bytes, thrusters, engines, '    ',
+                                     thruster_dirs, engine_dirs)
             self.report({'INFO'}, f"Exported {exported_mesh_count} meshes, {len(material_infos)} materials, {len(thrusters)} thrusters, {len(engines)} engines. XML: {xml_out_path}")
         except Exception as e:
             self.report({'ERROR'}, f"XML write failed: {e}")
@@ -423,6 +479,40 @@ class OBJECT_OT_export_ksa_metadata(bpy.types.Operator):
 
         return {'FINISHED'}
 
+def _make_ksa_empty(context, name, display_type, display_size, tag):
+    """Create an Empty tagged with ``tag`` in the active collection and return it."""
+    obj = bpy.data.objects.new(name, None)
+    try:
+        context.collection.objects.link(obj)
+    except Exception:
+        # No active collection in this context; leave the object unlinked
+        pass
+    obj.empty_display_type = display_type
+    obj.empty_display_size = display_size
+    obj.rotation_euler = (0, _NEG_HALF_PI, 0)
+    obj[tag] = True
+    obj['_no_export'] = True
+    return obj
+
+def _make_thruster(context):
+    return _make_ksa_empty(context, "Thruster", 'SINGLE_ARROW', 0.3, '_is_thruster')
+
+def _make_engine(context):
+    return _make_ksa_empty(context, "Engine", 'CONE', 0.5, '_is_engine')
+
+def _select_only(context, obj):
+    """Make ``obj`` the only selected object and the active one."""
+    try:
+        # Deselect directly instead of dispatching select_all: only the selected
+        # objects are touched, and it works outside a 3D View context
+        for other in context.selected_objects:
+            other.select_set(False)
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
+    except Exception:
+        # obj is not in the view layer (no collection to link it to)
+        pass
+
 class OBJECT_OT_add_thruster(bpy.types.Operator):
     bl_idname = "object.add_thruster"
     bl_label = "Add Thruster"
@@ -430,28 +520,7 @@ class OBJECT_OT_add_thruster(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        obj = bpy.data.objects.new("Thruster", None)
-        try:
-            context.collection.objects.link(obj)
-        except Exception:
-            pass
-        try:
-            obj.empty_display_type = 'SINGLE_ARROW'
-            obj.empty_display_size = 0.3
-            obj.rotation_euler = (0, -math.pi / 2, 0)
-        except Exception:
-            pass
-        try:
-            obj['_is_thruster'] = True
-            obj['_no_export'] = True
-        except Exception:
-            pass
-        try:
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
-        except Exception:
-            pass
+        _select_only(context, _make_thruster(context))
         return {'FINISHED'}
 
 class OBJECT_OT_add_engine(bpy.types.Operator):
@@ -461,28 +530,7 @@ class OBJECT_OT_add_engine(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        obj = bpy.data.objects.new("Engine", None)
-        try:
-            context.collection.objects.link(obj)
-        except Exception:
-            pass
-        try:
-            obj.empty_display_type = 'CONE'
-            obj.empty_display_size = 0.5
-            obj.rotation_euler = (0, -math.pi / 2, 0)
-        except Exception:
-            pass
-        try:
-            obj['_is_engine'] = True
-            obj['_no_export'] = True
-        except Exception:
-            pass
-        try:
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
-        except Exception:
-            pass
+        _select_only(context, _make_engine(context))
         return {'FINISHED'}
 
 class OBJECT_OT_export_thrusters_OLD(bpy.types.Operator):
@@ -492,7 +540,7 @@ class OBJECT_OT_export_thrusters_OLD(bpy.types.Operator):
     
     filepath: bpy.props.StringProperty(
         name="Filepath",
-        description="Where to write the JSON export. If empty, print to console.",
+        description="Where to write the JSON export. If empty, print a summary to the console.",
         default="",
     )
 
@@ -505,39 +553,27 @@ class OBJECT_OT_export_thrusters_OLD(bpy.types.Operator):
 
     def execute(self, context):
         data = []
+        # Bind loop-invariant lookups once instead of per selected object
+        add = data.append
         for obj in getattr(context, 'selected_objects', []):
-            kp = getattr(obj, 'thruster_props', None)
-            if kp is None or not getattr(kp, 'exportable', False):
+            kp = obj.thruster_props
+            if not kp.exportable:
                 continue
-            entry = {
-                'name': getattr(obj, 'name', ''),
-                'location': list(obj.location) if obj.location is not None else None,
-                'rotation': list(obj.rotation_euler) if obj.rotation_euler is not None else None,
-                'fx_location': _safe_vector_to_list(kp.fx_location),
-                'thrust_n': kp.thrust_n,
-                'specific_impulse_seconds': kp.specific_impulse_seconds,
-                'minimum_pulse_time_seconds': kp.minimum_pulse_time_seconds,
-                'volumetric_exhaust_id': kp.volumetric_exhaust_id,
-                'sound_event_on': kp.sound_event_on,
-                'control_map_translation': _safe_vector_to_list(kp.control_map_translation),
-                'control_map_rotation': _safe_vector_to_list(kp.control_map_rotation),
-                'exportable': kp.exportable,
-            }
-            data.append(entry)
-        xml_text = thrusters_list_to_xml_str(data)
+            # Object.location/rotation_euler always exist; [:] copies them in one C call
+            add(_thruster_entry(getattr(obj, 'name', ''), kp, obj.location[:],
+                                rotation=obj.rotation_euler[:], fx_location=kp.fx_location[:]))
         if getattr(self, 'filepath', ''):
             try:
-                path = self.filepath
-                if path.lower().endswith('.json'):
-                    path = path[:-5] + '.xml'
-                with open(path, 'w', encoding='utf-8') as f:
-                    f.write(xml_text)
+                path = xml_export_path(self.filepath)
+                with atomic_open(path) as f:
+                    write_thrusters_xml(f, data)
                 self.report({'INFO'}, f"Exported {len(data)} items to {path}")
             except Exception as e:
                 self.report({'ERROR'}, str(e))
                 return {'CANCELLED'}
         else:
-            print("Thruster export (XML):\n", xml_text)
+            # No file to write: skip serialization and just list what would be exported
+            _print_export_summary("Thruster", data)
             self.report({'INFO'}, f"Prepared export for {len(data)} objects (printed to console)")
         return {'FINISHED'}
 
@@ -548,27 +584,17 @@ class OBJECT_OT_bake_thruster_meta(bpy.types.Operator):
 
     def execute(self, context):
         count = 0
+        to_xml = meta_dict_to_xml_str
         for obj in getattr(context, 'selected_objects', []):
-            kp = getattr(obj, 'thruster_props', None)
-            if kp is None: continue
+            kp = obj.thruster_props
             try:
-                meta = {
-                    'name': obj.name,
-                    'thrust_n': kp.thrust_n,
-                    'specific_impulse_seconds': kp.specific_impulse_seconds,
-                    'minimum_pulse_time_seconds': kp.minimum_pulse_time_seconds,
-                    'volumetric_exhaust_id': kp.volumetric_exhaust_id,
-                    'sound_event_on': kp.sound_event_on,
-                    'control_map_translation': _safe_vector_to_list(kp.control_map_translation),
-                    'control_map_rotation': _safe_vector_to_list(kp.control_map_rotation),
-                    'exportable': kp.exportable,
-                    'location': list(obj.location) if obj.location is not None else None,
-                }
-                obj['_thruster_meta'] = meta_dict_to_xml_str(meta)
-                obj['_no_export'] = True
+                obj['_thruster_meta'] = to_xml(_thruster_entry(obj.name, kp, obj.location[:]))
+                # Re-bakes find the flag already set; skip the redundant ID-property write
+                if not obj.get('_no_export'):
+                    obj['_no_export'] = True
                 count += 1
             except Exception:
-                pass
+                log.debug("Could not bake thruster metadata for %s", obj.name, exc_info=True)
         self.report({'INFO'}, f"Baked metadata for {count} objects")
         return {'FINISHED'}
 
@@ -579,7 +605,7 @@ class OBJECT_OT_export_engines(bpy.types.Operator):
     
     filepath: bpy.props.StringProperty(
         name="Filepath",
-        description="Where to write the XML export. If empty, print to console.",
+        description="Where to write the XML export. If empty, print a summary to the console.",
         default="",
     )
 
@@ -592,36 +618,25 @@ class OBJECT_OT_export_engines(bpy.types.Operator):
 
     def execute(self, context):
         data = []
+        add = data.append
         for obj in getattr(context, 'selected_objects', []):
-            ep = getattr(obj, 'engine_props', None)
-            if ep is None or not getattr(ep, 'exportable', False):
+            ep = obj.engine_props
+            if not ep.exportable:
                 continue
-            entry = {
-                'name': getattr(obj, 'name', ''),
-                'location': list(obj.location) if obj.location is not None else None,
-                'rotation': list(obj.rotation_euler) if obj.rotation_euler is not None else None,
-                'thrust_kn': ep.thrust_kn,
-                'specific_impulse_seconds': ep.specific_impulse_seconds,
-                'minimum_throttle': ep.minimum_throttle,
-                'volumetric_exhaust_id': ep.volumetric_exhaust_id,
-                'sound_event_action_on': ep.sound_event_action_on,
-                'exportable': ep.exportable,
-            }
-            data.append(entry)
-        xml_text = engines_list_to_xml_str(data)
+            # Object.location/rotation_euler always exist; [:] copies them in one C call
+            add(_engine_entry(getattr(obj, 'name', ''), ep, obj.location[:],
+                              rotation=obj.rotation_euler[:]))
         if getattr(self, 'filepath', ''):
             try:
-                path = self.filepath
-                if path.lower().endswith('.json'):
-                    path = path[:-5] + '.xml'
-                with open(path, 'w', encoding='utf-8') as f:
-                    f.write(xml_text)
+                path = xml_export_path(self.filepath)
+                with atomic_open(path) as f:
+                    write_engines_xml(f, data)
                 self.report({'INFO'}, f"Exported {len(data)} engine items to {path}")
             except Exception as e:
                 self.report({'ERROR'}, str(e))
                 return {'CANCELLED'}
         else:
-            print("Engine export (XML):\n", xml_text)
+            _print_export_summary("Engine", data)
             self.report({'INFO'}, f"Prepared export for {len(data)} engine objects (printed to console)")
         return {'FINISHED'}
 
@@ -632,32 +647,24 @@ class OBJECT_OT_bake_engine_meta(bpy.types.Operator):
 
     def execute(self, context):
         count = 0
+        to_xml = meta_dict_to_xml_str
         for obj in getattr(context, 'selected_objects', []):
-            ep = getattr(obj, 'engine_props', None)
-            if ep is None: continue
+            ep = obj.engine_props
             try:
-                meta = {
-                    'name': obj.name,
-                    'thrust_kn': ep.thrust_kn,
-                    'specific_impulse_seconds': ep.specific_impulse_seconds,
-                    'minimum_throttle': ep.minimum_throttle,
-                    'volumetric_exhaust_id': ep.volumetric_exhaust_id,
-                    'sound_event_action_on': ep.sound_event_action_on,
-                    'exportable': ep.exportable,
-                    'location': list(obj.location) if obj.location is not None else None,
-                }
-                obj['_engine_meta'] = meta_dict_to_xml_str(meta)
-                obj['_no_export'] = True
+                obj['_engine_meta'] = to_xml(_engine_entry(obj.name, ep, obj.location[:]))
+                # Re-bakes find the flag already set; skip the redundant ID-property write
+                if not obj.get('_no_export'):
+                    obj['_no_export'] = True
                 count += 1
             except Exception:
-                pass
+                log.debug("Could not bake engine metadata for %s", obj.name, exc_info=True)
         self.report({'INFO'}, f"Baked engine metadata for {count} objects")
         return {'FINISHED'}
 
 class OBJECT_OT_export_glb_with_meta(bpy.types.Operator):
     bl_idname = "export.glb_with_meta"
     bl_label = "Export GLB + Thruster Metadata"
-    bl_description = "Export scene to GLB excluding thruster objects and write thruster metadata JSON"
+    bl_description = "Export the visible scene objects to GLB, leaving out thrusters, and write thruster metadata (XML, JSON or binary)"
     
     filepath: bpy.props.StringProperty(
         name="Filepath",
@@ -666,6 +673,16 @@ class OBJECT_OT_export_glb_with_meta(bpy.types.Operator):
         default="",
     )
 
+    meta_format: bpy.props.EnumProperty(
+        items=[
+            ('XML', "XML", "Write <name>_meta.xml in the KSA Thrusters format"),
+            ('JSON', "JSON", "Write <name>_meta.json with the raw metadata entries"),
+            ('BINARY', "Binary", "Write <name>_meta.bin, a packed struct layout for tools"),
+        ],
+        name="Metadata Format",
+        default='XML',
+    )
+
     def invoke(self, context, event):
         try:
             context.window_manager.fileselect_add(self)
@@ -678,69 +695,57 @@ class OBJECT_OT_export_glb_with_meta(bpy.types.Operator):
         if scene is None:
             self.report({'ERROR'}, "No scene found")
             return {'CANCELLED'}
-        thrusters = [o for o in scene.objects if (o.get('_thruster_meta') is not None) or (getattr(o, 'thruster_props', None) is not None)]
-        non_thrusters = [o for o in scene.objects if o not in thrusters]
-        prev_selected = [o for o in context.selected_objects]
-        prev_active = getattr(context.view_layer, 'objects', None) and context.view_layer.objects.active
-        try:
-            try:
-                bpy.ops.object.select_all(action='DESELECT')
-            except Exception: pass
-            for o in non_thrusters:
-                try: o.select_set(True)
-                except Exception: pass
-            if non_thrusters:
-                try: context.view_layer.objects.active = non_thrusters[0]
-                except Exception: pass
-            try:
-                bpy.ops.export_scene.gltf(filepath=self.filepath, export_format='GLB', use_selection=True)
-            except Exception as e:
-                self.report({'ERROR'}, f"GLB export failed: {e}")
-                return {'CANCELLED'}
-            meta_list = []
-            for o in thrusters:
-                jm = o.get('_thruster_meta')
-                if jm:
-                    parsed = parse_meta_string(jm)
-                    if isinstance(parsed, dict):
-                        meta_list.append(parsed)
-                        continue
-                    elif isinstance(parsed, list):
-                        meta_list.extend(parsed)
-                        continue
-                kp = getattr(o, 'thruster_props', None)
-                if kp is not None:
-                    entry = {
-                        'name': o.name,
-                        'thrust_n': kp.thrust_n,
-                        'specific_impulse_seconds': kp.specific_impulse_seconds,
-                        'minimum_pulse_time_seconds': kp.minimum_pulse_time_seconds,
-                        'volumetric_exhaust_id': kp.volumetric_exhaust_id,
-                        'sound_event_on': kp.sound_event_on,
-                        'control_map_translation': _safe_vector_to_list(kp.control_map_translation),
-                        'control_map_rotation': _safe_vector_to_list(kp.control_map_rotation),
-                        'exportable': kp.exportable,
-                        'location': list(o.location) if o.location is not None else None,
-                    }
-                    meta_list.append(entry)
-            base = os.path.splitext(self.filepath)[0]
+        objects = scene.objects
+        # Materialize the scene's objects once; the partition below reuses the list
+        all_objs = list(objects)
+        # Partition in a single pass. thruster_props is registered on every Object,
+        # so thrusters are recognized by their custom-property tags or, like in
+        # export_ksa_metadata and the thruster panel, by their name.
+        thrusters = []
+        thruster_idx = []
+        for i, o in enumerate(all_objs):
+            keys = o.keys()
+            if '_thruster_meta' in keys or '_is_thruster' in keys or o.name.startswith('Thruster'):
+                thrusters.append(o)
+                thruster_idx.append(i)
+        # The metadata file sits next to the GLB: <name>_meta.xml / <name>_meta.json
+        base = os.path.splitext(self.filepath)[0]
+        if self.meta_format == 'JSON':
+            meta_path = base + '_meta.json'
+            write_meta = lambda f, data: f.write(meta_list_to_json_bytes(data))
+        elif self.meta_format == 'BINARY':
+            meta_path = base + '_meta.bin'
+            write_meta = lambda f, data: f.write(thrusters_list_to_binary_bytes(data))
+        else:
             meta_path = base + '_meta.xml'
-            try:
-                xml_text = thrusters_list_to_xml_str(meta_list)
-                with open(meta_path, 'w', encoding='utf-8') as f:
-                    f.write(xml_text)
-            except Exception as e:
-                self.report({'WARNING'}, f"GLB exported but failed to write meta file: {e}")
-                return {'FINISHED'}
-            self.report({'INFO'}, f"Exported GLB and wrote {len(meta_list)} metadata entries to {meta_path}")
+            write_meta = write_thrusters_xml
+        # Keep thrusters out of the GLB by hiding them for the export and letting the
+        # glTF exporter take visible objects. Only the few thrusters are touched,
+        # and the user's selection is left untouched. Objects the user has hidden or
+        # that sit in an excluded collection are not visible, so they stay out too.
+        try:
+            with _temporarily_hidden(thrusters):
+                bpy.ops.export_scene.gltf(filepath=self.filepath, export_format='GLB', use_visible=True)
+        except Exception as e:
+            self.report({'ERROR'}, f"GLB export failed: {e}")
+            return {'CANCELLED'}
+        meta_list = []
+        loc_rows = _foreach_rows(objects, 'location') if thrusters else ()
+        add_parsed = {META_DICT: meta_list.append, META_LIST: meta_list.extend}.get
+        for o, i in zip(thrusters, thruster_idx):
+            jm = o.get('_thruster_meta')
+            if jm:
+                kind, parsed = parse_meta_string_typed(jm)
+                handler = add_parsed(kind)
+                if handler is not None:
+                    handler(parsed)
+                    continue
+            meta_list.append(_thruster_entry(o.name, o.thruster_props, loc_rows[i]))
+        try:
+            with atomic_open(meta_path) as f:
+                write_meta(f, meta_list)
+        except Exception as e:
+            self.report({'WARNING'}, f"GLB exported but failed to write meta file: {e}")
             return {'FINISHED'}
-        finally:
-            try: bpy.ops.object.select_all(action='DESELECT')
-            except Exception: pass
-            for o in prev_selected:
-                try: o.select_set(True)
-                except Exception: pass
-            try:
-                if prev_active is not None:
-                    context.view_layer.objects.active = prev_active
-            except Exception: pass
+        self.report({'INFO'}, f"Exported GLB and wrote {len(meta_list)} metadata entries to {meta_path}")
+        return {'FINISHED'}
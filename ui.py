@@ -11,7 +11,9 @@ class OBJECT_PT_thruster_panel(bpy.types.Panel):
     def poll(cls, context):
         obj = getattr(context, 'object', None)
         if obj is None: return False
-        return obj.get('_is_thruster') is not None or obj.get('_thruster_meta') is not None or obj.name.startswith('Thruster')
+        # One RNA call for both tags; the name test only runs for untagged objects
+        keys = obj.keys()
+        return '_is_thruster' in keys or '_thruster_meta' in keys or obj.name.startswith('Thruster')
 
     def draw(self, context):
         layout = self.layout
@@ -54,7 +56,9 @@ class OBJECT_PT_engine_panel(bpy.types.Panel):
     def poll(cls, context):
         obj = getattr(context, 'object', None)
         if obj is None: return False
-        return obj.get('_is_engine') is not None or obj.get('_engine_meta') is not None or obj.name.startswith('Engine')
+        # One RNA call for both tags; the name test only runs for untagged objects
+        keys = obj.keys()
+        return '_is_engine' in keys or '_engine_meta' in keys or obj.name.startswith('Engine')
 
     def draw(self, context):
         layout = self.layout
@@ -1,193 +1,575 @@
+import copy
 import json
-import math
-import mathutils
-import xml.etree.ElementTree as ET
+import os
+import re
+import struct
+import sys
+import numpy as np
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, compress
+from math import cos as _cos, sin as _sin
 
-def _safe_vector_to_list(vec_prop):
-    """Safely convert a Blender vector property to a Python list."""
-    try:
-        return list(vec_prop)
-    except TypeError:
+# lxml serializes in C against libxml2; fall back to the stdlib when it is not installed.
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# orjson encodes in C; it is optional (not bundled with Blender), json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ControlMap labels, in the order of ThrusterProperties.control_map_translation/_rotation
+_TRANS_LABELS = ("TranslateForward", "TranslateBackward", "TranslateLeft", "TranslateRight", "TranslateUp", "TranslateDown")
+_ROT_LABELS = ("PitchUp", "PitchDown", "RollLeft", "RollRight", "YawLeft", "YawRight")
+# CSV per (translation flags, rotation flags) combination; 12 flags give at most 4096 entries
+_CTRL_CSV_CACHE = {}
+
+def _control_map_csv(trans_map, rot_map):
+    """ControlMap CSV for the given flag vectors, memoized per flag combination."""
+    key = (tuple(trans_map or ()), tuple(rot_map or ()))
+    csv_value = _CTRL_CSV_CACHE.get(key)
+    if csv_value is None:
+        csv_value = ','.join(chain(compress(_TRANS_LABELS, key[0]), compress(_ROT_LABELS, key[1])))
+        if len(_CTRL_CSV_CACHE) < 4096:
+            _CTRL_CSV_CACHE[key] = csv_value
+    return csv_value
+
+# Fixed-precision formatter for numeric XML attributes. Blender stores these
+# values as single-precision floats, so 7 significant digits keep everything
+# meaningful while dropping float noise such as 0.30000000000000004.
+_F = '{:.7g}'.format
+
+# Formatted thrust/impulse/throttle values; entries mostly share a few of them
+_SCALAR_ATTR_CACHE = {}
+
+def _scalar_attr(value):
+    """_F for the per-entry scalar properties, memoized per value."""
+    if not value:
+        # 0.0 and -0.0 compare equal but format differently; don't share a key
+        return _F(value)
+    text = _SCALAR_ATTR_CACHE.get(value)
+    if text is None:
+        text = _F(value)
+        if len(_SCALAR_ATTR_CACHE) < 4096:
+            _SCALAR_ATTR_CACHE[value] = text
+    return text
+
+# Shared defaults for the VolumetricExhaust/SoundEvent ids (match properties.py)
+_APOLLO_RCS = sys.intern('ApolloRCS')
+_DEFAULT_RCS_THRUSTER = sys.intern('DefaultRcsThruster')
+_APOLLO_CSM = sys.intern('ApolloCSM')
+_DEFAULT_ENG = sys.intern('DefaultEngineSoundBehavior')
+
+# Shared default for missing location/fx_location/rotation keys (never mutated)
+_ZERO3 = (0.0, 0.0, 0.0)
+
+# Exhaust directions of an unrotated thruster (local +Z) and engine (+X)
+_THRUSTER_IDENTITY_DIR = (0.0, 0.0, 1.0)
+_ENGINE_IDENTITY_DIR = (1.0, 0.0, 0.0)
+
+def _rotation_array(list_of_meta):
+    """Stack the entries' Euler rotations into an (N, 3) float64 array plus a mask
+    of entries that actually carry a rotation."""
+    # Same convention as the scalar path: a missing key means zero rotation,
+    # an explicit None/empty rotation falls back to the default direction.
+    has_rot = np.array([bool(m.get('rotation', True)) for m in list_of_meta], dtype=bool)
+    rot = np.array([m.get('rotation') or (0.0, 0.0, 0.0) for m in list_of_meta],
+                   dtype=np.float64).reshape(-1, 3)
+    return rot, has_rot
+
+# Below this many rows the numba kernels' JIT/parallel dispatch costs more than NumPy.
+_NUMBA_MIN_ROWS = 1024
+_numba_kernels = None
+
+def _get_numba_kernels():
+    """Return (thruster_kernel, engine_kernel) compiled with numba, or (None, None)
+    when numba is not installed or unusable. numba is optional and only imported
+    on first use."""
+    global _numba_kernels
+    if _numba_kernels is None:
         try:
-            return [vec_prop[i] for i in range(len(vec_prop))]
+            from numba import njit, prange
+
+            @njit(cache=True, parallel=True)
+            def thruster_kernel(rot):
+                out = np.empty_like(rot)
+                for i in prange(rot.shape[0]):
+                    sa, ca = np.sin(rot[i, 0]), np.cos(rot[i, 0])
+                    sb, cb = np.sin(rot[i, 1]), np.cos(rot[i, 1])
+                    sc, cc = np.sin(rot[i, 2]), np.cos(rot[i, 2])
+                    out[i, 0] = cc * sb * ca + sc * sa
+                    out[i, 1] = sc * sb * ca - cc * sa
+                    out[i, 2] = cb * ca
+                return out
+
+            @njit(cache=True, parallel=True)
+            def engine_kernel(rot):
+                out = np.empty_like(rot)
+                for i in prange(rot.shape[0]):
+                    cy = np.cos(rot[i, 1])
+                    out[i, 0] = cy * np.cos(rot[i, 2])
+                    out[i, 1] = cy * np.sin(rot[i, 2])
+                    out[i, 2] = np.sin(rot[i, 1])
+                return out
         except Exception:
-            try:
-                return [x for x in vec_prop]
-            except Exception:
-                return None
+            _numba_kernels = (None, None)
+        else:
+            _numba_kernels = (thruster_kernel, engine_kernel)
+    return _numba_kernels
 
-def _thruster_dict_to_xml_element(parent, thruster_data):
-    """Convert a single thruster dict to KSA-format XML element."""
-    thruster = ET.SubElement(parent, 'Thruster', Id=thruster_data.get('name', 'Unnamed'))
+def _run_numba_kernel(index, rot):
+    """Directions from numba kernel ``index`` for large batches, or None to use NumPy.
 
-    # Location
-    loc = thruster_data.get('location', [0.0, 0.0, 0.0])
-    fx_offset = thruster_data.get('fx_location', [0.0, 0.0, 0.0])
-    
-    if loc and fx_offset:
-        final_loc = [loc[0] + fx_offset[0], loc[1] + fx_offset[1], loc[2] + fx_offset[2]]
-    else:
-        final_loc = loc
-        
-    if final_loc:
-        ET.SubElement(thruster, 'Location', X=str(final_loc[0]), Y=str(final_loc[1]), Z=str(final_loc[2]))
+    Compilation happens on the first call, so a numba install that cannot build
+    the kernels (no threading layer for parallel=True, unwritable cache=True
+    directory, ...) fails there; numba is then disabled for the session.
+    """
+    global _numba_kernels
+    if len(rot) < _NUMBA_MIN_ROWS:
+        return None
+    kernel = _get_numba_kernels()[index]
+    if kernel is None:
+        return None
+    try:
+        return kernel(rot)
+    except Exception:
+        _numba_kernels = (None, None)
+        return None
+
+def _thruster_dirs(rot):
+    """Exhaust directions for an (N, 3) float64 array of XYZ Euler rotations:
+    local +Z rotated by each Euler, i.e. the third column of Rz @ Ry @ Rx."""
+    dirs = _run_numba_kernel(0, rot)
+    if dirs is not None:
+        return dirs
+    sa, ca = np.sin(rot[:, 0]), np.cos(rot[:, 0])
+    sb, cb = np.sin(rot[:, 1]), np.cos(rot[:, 1])
+    sc, cc = np.sin(rot[:, 2]), np.cos(rot[:, 2])
+    return np.stack([cc * sb * ca + sc * sa, sc * sb * ca - cc * sa, cb * ca], axis=1)
+
+def _engine_dirs(rot):
+    """Engine exhaust directions for an (N, 3) float64 array of Euler rotations."""
+    dirs = _run_numba_kernel(1, rot)
+    if dirs is not None:
+        return dirs
+    ry, rz = rot[:, 1], rot[:, 2]
+    cy = np.cos(ry)
+    return np.stack([cy * np.cos(rz), cy * np.sin(rz), np.sin(ry)], axis=1)
+
+def _rows(dirs):
+    dirs += 0.0  # normalize -0.0 so it is written as 0
+    return dirs.tolist()
+
+def thruster_exhaust_directions(list_of_meta):
+    """Exhaust directions for a list of thruster dicts as a list of [x, y, z].
+
+    Vectorized equivalent of _thruster_direction.
+    """
+    if not list_of_meta:
+        return []
+    rot, has_rot = _rotation_array(list_of_meta)
+    dirs = _thruster_dirs(rot)
+    dirs[~has_rot] = (1.0, 0.0, 0.0)
+    return _rows(dirs)
+
+def engine_exhaust_directions(list_of_meta):
+    """Exhaust directions for a list of engine dicts as a list of [x, y, z].
+
+    Vectorized equivalent of _engine_direction.
+    """
+    if not list_of_meta:
+        return []
+    rot, has_rot = _rotation_array(list_of_meta)
+    dirs = _engine_dirs(rot)
+    dirs[~has_rot] = (1.0, 0.0, 0.0)
+    return _rows(dirs)
+
+def thruster_directions_from_rotations(rotations):
+    """Thruster exhaust directions for an (N, 3) array of Euler rotations (columnar input)."""
+    return _rows(_thruster_dirs(np.asarray(rotations, dtype=np.float64).reshape(-1, 3)))
 
-    # ExhaustDirection
-    rotation = thruster_data.get('rotation', [0.0, 0.0, 0.0])  # Euler angles in radians (x, y, z)
+def engine_directions_from_rotations(rotations):
+    """Engine exhaust directions for an (N, 3) array of Euler rotations (columnar input)."""
+    return _rows(_engine_dirs(np.asarray(rotations, dtype=np.float64).reshape(-1, 3)))
 
+def _thruster_direction(rotation):
+    """Exhaust direction for one thruster's Euler rotation (radians, XYZ)."""
+    if rotation and not any(rotation):
+        return _THRUSTER_IDENTITY_DIR
     if rotation:
-        try:
-            eul = mathutils.Euler(rotation, 'XYZ')
-            # Rotate local +Z to world space
-            dir_vec = eul.to_matrix() @ mathutils.Vector((0.0, 0.0, 1.0))
-            if dir_vec.length_squared > 0.0:
-                dir_vec.normalize()
-            ex_dir = [dir_vec.x, dir_vec.y, dir_vec.z]
-        except Exception:
-            # Fallback if mathutils is not available for some reason
-            ex_dir = [1.0, 0.0, 0.0]
-    else:
-        # Default: forward in your KSA system
-        ex_dir = [1.0, 0.0, 0.0]
-
-    ET.SubElement(thruster, 'ExhaustDirection', X=str(ex_dir[0]), Y=str(ex_dir[1]), Z=str(ex_dir[2]))
-
-    # ControlMap
-    csv_parts = []
-    trans_map = thruster_data.get('control_map_translation', [])
-    rot_map = thruster_data.get('control_map_rotation', [])
-    
-    trans_labels = ["TranslateForward", "TranslateBackward", "TranslateLeft", "TranslateRight", "TranslateUp", "TranslateDown"]
-    rot_labels = ["PitchUp", "PitchDown", "RollLeft", "RollRight", "YawLeft", "YawRight"]
-
-    if trans_map:
-        for i, enabled in enumerate(trans_map):
-            if enabled and i < len(trans_labels):
-                csv_parts.append(trans_labels[i])
-                
-    if rot_map:
-        for i, enabled in enumerate(rot_map):
-            if enabled and i < len(rot_labels):
-                csv_parts.append(rot_labels[i])
-
-    csv_value = ','.join(csv_parts) if csv_parts else ''
-    ET.SubElement(thruster, 'ControlMap', CSV=csv_value)
-
-    # Attributes
-    ET.SubElement(thruster, 'Thrust', N=str(thruster_data.get('thrust_n', 40.0)))
-    ET.SubElement(thruster, 'SpecificImpulse', Seconds=str(thruster_data.get('specific_impulse_seconds', 220.0)))
-    ET.SubElement(thruster, 'MinimumPulseTime', Seconds=str(thruster_data.get('minimum_pulse_time_seconds', 0.008)))
-    ET.SubElement(thruster, 'VolumetricExhaust', Id=thruster_data.get('volumetric_exhaust_id', 'ApolloRCS'))
-    ET.SubElement(thruster, 'SoundEvent', Action='On', SoundId=thruster_data.get('sound_event_on', 'DefaultRcsThruster'))
-
-def _engine_dict_to_xml_element(parent, engine_data):
-    """Convert a single engine dict to KSA-format XML element."""
-    engine = ET.SubElement(parent, 'Engine', Id=engine_data.get('name', 'Unnamed'))
-
-    # Location
-    loc = engine_data.get('location', [0.0, 0.0, 0.0])
-    if loc:
-        ET.SubElement(engine, 'Location', X=str(loc[0]), Y=str(loc[1]), Z=str(loc[2]))
+        # Local +Z rotated by the XYZ Euler: third column of Rz @ Ry @ Rx, the
+        # same closed form the vectorized thruster_exhaust_directions uses
+        rx, ry, rz = rotation
+        sa, ca = _sin(rx), _cos(rx)
+        sb, cb = _sin(ry), _cos(ry)
+        sc, cc = _sin(rz), _cos(rz)
+        # + 0.0 turns -0.0 into 0.0, as the vectorized path does
+        return [cc * sb * ca + sc * sa + 0.0, sc * sb * ca - cc * sa + 0.0, cb * ca + 0.0]
+    # Default: forward in your KSA system
+    return [1.0, 0.0, 0.0]
 
-    # ExhaustDirection
-    rotation = engine_data.get('rotation', [0.0, 0.0, 0.0])
+def _engine_direction(rotation):
+    """Exhaust direction for one engine's Euler rotation (radians, XYZ)."""
+    if rotation and not any(rotation):
+        return _ENGINE_IDENTITY_DIR
     if rotation:
-        cos_y = math.cos(rotation[1])
-        sin_y = math.sin(rotation[1])
-        cos_z = math.cos(rotation[2])
-        sin_z = math.sin(rotation[2])
+        _, ry, rz = rotation
+        cos_y = _cos(ry)
+        sin_y = _sin(ry)
+        cos_z = _cos(rz)
+        sin_z = _sin(rz)
         
-        ex_dir = [
+        return [
             cos_y * cos_z,
             cos_y * sin_z,
             sin_y
         ]
+    return [1.0, 0.0, 0.0]
+
+# Direct emitters. The thruster/engine blocks have a fixed schema, so they are
+# written straight to text instead of going through Element objects; the
+# output matches ET.tostring + _indent_xml (2-space indent, CRLF).
+_XML_DECL = "<?xml version='1.0' encoding='utf-8'?>\r\n"
+_ATTR_ESCAPES = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;',
+    '\n': '&#10;', '\r': '&#13;', '\t': '&#09;',
+})
+
+_NEEDS_ESCAPE = re.compile('[&<>"\n\r\t]').search
+
+def _attr(value):
+    """Escape a string for use inside a double-quoted XML attribute."""
+    # Names and ids rarely contain markup characters: the regex pre-check is far
+    # cheaper than translate() and lets those strings through unchanged.
+    return value.translate(_ATTR_ESCAPES) if _NEEDS_ESCAPE(value) else value
+
+# Escaped exhaust/sound ids; scenes reuse a handful of them across every entry
+_ID_ATTR_CACHE = {}
+
+def _id_attr(value):
+    """_attr for the VolumetricExhaust/SoundEvent ids, memoized per id."""
+    escaped = _ID_ATTR_CACHE.get(value)
+    if escaped is None:
+        escaped = _attr(value)
+        if len(_ID_ATTR_CACHE) < 4096:
+            _ID_ATTR_CACHE[value] = escaped
+    return escaped
+
+_LOCATION_LINE = '<Location X="%s" Y="%s" Z="%s" />'
+
+@lru_cache(maxsize=None)
+def _block_template(tag, body, indent, with_location):
+    """``%`` template of a serialized block: the open tag, optional Location, the
+    fixed ``body`` lines and the close tag, with line breaks for ``indent``."""
+    lines = ['<%s Id="%%s">' % tag]
+    if with_location:
+        lines.append(_LOCATION_LINE)
+    lines += body
+    return ('\r\n' + indent + '  ').join(lines) + '\r\n' + indent + '</%s>' % tag
+
+_THRUSTER_BODY = (
+    '<ExhaustDirection X="%s" Y="%s" Z="%s" />',
+    '<ControlMap CSV="%s" />',
+    '<Thrust N="%s" />',
+    '<SpecificImpulse Seconds="%s" />',
+    '<MinimumPulseTime Seconds="%s" />',
+    '<VolumetricExhaust Id="%s" />',
+    '<SoundEvent Action="On" SoundId="%s" />',
+)
+
+_ENGINE_BODY = (
+    '<ExhaustDirection X="%s" Y="%s" Z="%s" />',
+    '<Thrust N="%s" />',
+    '<SpecificImpulse Seconds="%s" />',
+    '<MinimumThrottle Value="%s" />',
+    '<VolumetricExhaust Id="%s" />',
+    '<SoundEvent Action="On" SoundId="%s" />',
+)
+
+def _thruster_xml(thruster_data, ex_dir=None, indent=''):
+    """Serialized <Thruster> block. The first line carries no indentation,
+    following lines are prefixed with ``indent`` (the block's own level)."""
+    get = thruster_data.get
+    loc = get('location', _ZERO3)
+    fx_offset = get('fx_location', _ZERO3)
+    if loc and fx_offset:
+        lx, ly, lz = loc
+        fx, fy, fz = fx_offset
+        final_loc = (lx + fx, ly + fy, lz + fz)
+    else:
+        final_loc = loc
+    values = [_attr(get('name', 'Unnamed'))]
+    if final_loc:
+        values += (_F(final_loc[0]), _F(final_loc[1]), _F(final_loc[2]))
+
+    if ex_dir is None:
+        ex_dir = _thruster_direction(get('rotation', _ZERO3))
+    values += (
+        _F(ex_dir[0]), _F(ex_dir[1]), _F(ex_dir[2]),
+        _control_map_csv(get('control_map_translation', ()), get('control_map_rotation', ())),
+        _scalar_attr(get('thrust_n', 40.0)),
+        _scalar_attr(get('specific_impulse_seconds', 220.0)),
+        _scalar_attr(get('minimum_pulse_time_seconds', 0.008)),
+        _id_attr(get('volumetric_exhaust_id', _APOLLO_RCS)),
+        _id_attr(get('sound_event_on', _DEFAULT_RCS_THRUSTER)),
+    )
+    return _block_template('Thruster', _THRUSTER_BODY, indent, bool(final_loc)) % tuple(values)
+
+def _engine_xml(engine_data, ex_dir=None, indent=''):
+    """Serialized <Engine> block, indented like _thruster_xml."""
+    get = engine_data.get
+    loc = get('location', _ZERO3)
+    values = [_attr(get('name', 'Unnamed'))]
+    if loc:
+        values += (_F(loc[0]), _F(loc[1]), _F(loc[2]))
+
+    if ex_dir is None:
+        ex_dir = _engine_direction(get('rotation', _ZERO3))
+    values += (
+        _F(ex_dir[0]), _F(ex_dir[1]), _F(ex_dir[2]),
+        _scalar_attr(get('thrust_kn', 650.0) * 1000.0),
+        _scalar_attr(get('specific_impulse_seconds', 452.0)),
+        _scalar_attr(get('minimum_throttle', 0.05)),
+        _id_attr(get('volumetric_exhaust_id', _APOLLO_CSM)),
+        _id_attr(get('sound_event_action_on', _DEFAULT_ENG)),
+    )
+    return _block_template('Engine', _ENGINE_BODY, indent, bool(loc)) % tuple(values)
+
+# C-level indent(): lxml >= 4.5 and the stdlib since Python 3.9
+_indent = getattr(ET, 'indent', None)
+
+# lxml closes empty elements as '<X/>'; ElementTree and the direct emitters write
+# '<X />'. Normalize lxml's output so part.xml is identical on either backend.
+# '/>' only occurs in tags: both backends escape '>' in text and attribute values.
+_fix_empty_close = re.compile(rb'(?<! )/>').sub if ET.__name__.startswith('lxml') else None
+
+def _xml_bytes(root, xml_declaration=True):
+    """Pretty-print ``root`` and serialize it to CRLF-terminated UTF-8 bytes."""
+    # indent() lays out these attribute-only trees exactly like _indent_xml
+    if _indent is not None:
+        _indent(root, space='  ')
     else:
-        ex_dir = [1.0, 0.0, 0.0]
-
-    ET.SubElement(engine, 'ExhaustDirection', X=str(ex_dir[0]), Y=str(ex_dir[1]), Z=str(ex_dir[2]))
-
-    # Attributes
-    thrust_kn = engine_data.get('thrust_kn', 650.0)
-    ET.SubElement(engine, 'Thrust', N=str(thrust_kn * 1000.0))
-    ET.SubElement(engine, 'SpecificImpulse', Seconds=str(engine_data.get('specific_impulse_seconds', 452.0)))
-    ET.SubElement(engine, 'MinimumThrottle', Value=str(engine_data.get('minimum_throttle', 0.05)))
-    ET.SubElement(engine, 'VolumetricExhaust', Id=engine_data.get('volumetric_exhaust_id', 'ApolloCSM'))
-    ET.SubElement(engine, 'SoundEvent', Action='On', SoundId=engine_data.get('sound_event_action_on', 'DefaultEngineSoundBehavior'))
-
-def thrusters_list_to_xml_str(list_of_meta):
-    root = ET.Element('Thrusters')
-    for meta in list_of_meta:
-        _thruster_dict_to_xml_element(root, meta)
-    _indent_xml(root)
-    xml_str = ET.tostring(root, encoding='utf-8').decode('utf-8')
-    return xml_str.replace('\n', '\r\n')
-
-
-def engines_list_to_xml_str(list_of_meta):
-    root = ET.Element('Engines')
-    for meta in list_of_meta:
-        _engine_dict_to_xml_element(root, meta)
-    _indent_xml(root)
-    xml_str = ET.tostring(root, encoding='utf-8').decode('utf-8')
-    return xml_str.replace('\n', '\r\n')
+        _indent_xml(root)
+    data = ET.tostring(root, encoding='utf-8', xml_declaration=xml_declaration)
+    if _fix_empty_close is not None:
+        data = _fix_empty_close(b' />', data)
+    return data.replace(b'\n', b'\r\n')
+
+_SPLICE_MARK = 'kittenExport-blocks'
+
+def add_blocks_placeholder(parent):
+    """Reserve the spot in ``parent`` where write_spliced_blocks inserts the thruster/engine blocks."""
+    parent.append(ET.Comment(_SPLICE_MARK))
+
+def write_spliced_blocks(f, xml_bytes, thrusters, engines, indent, thruster_dirs=None, engine_dirs=None):
+    """Write ``xml_bytes`` to the binary file ``f``, streaming the thruster/engine
+    blocks into the placeholder one at a time.
+
+    The joined document is never built, so peak memory does not grow with the
+    number of blocks.
+    """
+    head, mark, tail = xml_bytes.partition(b'<!--' + _SPLICE_MARK.encode() + b'-->')
+    write = f.write
+    write(head)
+    if mark:
+        if thruster_dirs is None:
+            thruster_dirs = thruster_exhaust_directions(thrusters)
+        if engine_dirs is None:
+            engine_dirs = engine_exhaust_directions(engines)
+        sep = ('\r\n' + indent).encode('utf-8')
+        first = True
+        for block in chain(
+                (_thruster_xml(t, d, indent) for t, d in zip(thrusters, thruster_dirs)),
+                (_engine_xml(e, d, indent) for e, d in zip(engines, engine_dirs))):
+            if not first:
+                write(sep)
+            first = False
+            write(block.encode('utf-8'))
+    write(tail)
+
+def _write_list_document(f, tag, thrusters=(), engines=()):
+    """Write a <tag> document of thruster/engine blocks to ``f``, streaming them like write_spliced_blocks."""
+    if not thrusters and not engines:
+        f.write(('%s<%s />' % (_XML_DECL, tag)).encode('utf-8'))
+        return
+    frame = '%s<%s>\r\n  <!--%s-->\r\n</%s>' % (_XML_DECL, tag, _SPLICE_MARK, tag)
+    write_spliced_blocks(f, frame.encode('utf-8'), thrusters, engines, '  ')
+
+def write_thrusters_xml(f, list_of_meta):
+    """Write thrusters as a UTF-8 <Thrusters> document (with declaration) to the binary file ``f``."""
+    _write_list_document(f, 'Thrusters', thrusters=list_of_meta)
+
+def write_engines_xml(f, list_of_meta):
+    """Write engines as a UTF-8 <Engines> document (with declaration) to the binary file ``f``."""
+    _write_list_document(f, 'Engines', engines=list_of_meta)
+
+def meta_list_to_json_bytes(list_of_meta):
+    """Serialize metadata entries to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(list_of_meta)
+    return json.dumps(list_of_meta, ensure_ascii=False).encode('utf-8')
+
+# Binary thruster sidecar (little-endian):
+#   header:  magic b'KSAT', version:H, count:I
+#   record:  name, thrust N:f, specific impulse s:f, minimum pulse time s:f,
+#            location xyz:3f (NaN when absent), exhaust direction xyz:3f,
+#            control map bits:H (0-5 translation, 6-11 rotation, label order),
+#            flags:B (bit 0 exportable), volumetric exhaust id, sound id
+#   strings are UTF-8 prefixed with their byte length as H
+_BIN_MAGIC = b'KSAT'
+_BIN_VERSION = 1
+_BIN_HEADER = struct.Struct('<4sHI')
+_BIN_FIXED = struct.Struct('<9fHB')
+_BIN_STRLEN = struct.Struct('<H')
+_NAN = float('nan')
+
+def _control_bits(trans_map, rot_map):
+    bits = 0
+    for i, on in enumerate(trans_map or ()):
+        if on:
+            bits |= 1 << i
+    for i, on in enumerate(rot_map or ()):
+        if on:
+            bits |= 1 << (i + 6)
+    return bits
+
+def thrusters_list_to_binary_bytes(list_of_meta):
+    """Pack thrusters into the binary sidecar layout described above."""
+    records = []
+    size = _BIN_HEADER.size
+    for meta, ex_dir in zip(list_of_meta, thruster_exhaust_directions(list_of_meta)):
+        strings = (meta.get('name', 'Unnamed').encode('utf-8'),
+                   meta.get('volumetric_exhaust_id', _APOLLO_RCS).encode('utf-8'),
+                   meta.get('sound_event_on', _DEFAULT_RCS_THRUSTER).encode('utf-8'))
+        loc = meta.get('location', (0.0, 0.0, 0.0))
+        fx_offset = meta.get('fx_location', (0.0, 0.0, 0.0))
+        if loc and fx_offset:
+            loc = (loc[0] + fx_offset[0], loc[1] + fx_offset[1], loc[2] + fx_offset[2])
+        elif not loc:
+            loc = (_NAN, _NAN, _NAN)
+        fixed = (meta.get('thrust_n', 40.0), meta.get('specific_impulse_seconds', 220.0),
+                 meta.get('minimum_pulse_time_seconds', 0.008), *loc, *ex_dir,
+                 _control_bits(meta.get('control_map_translation'), meta.get('control_map_rotation')),
+                 1 if meta.get('exportable', True) else 0)
+        records.append((strings, fixed))
+        size += _BIN_FIXED.size + sum(_BIN_STRLEN.size + len(b) for b in strings)
+
+    buf = bytearray(size)
+    _BIN_HEADER.pack_into(buf, 0, _BIN_MAGIC, _BIN_VERSION, len(records))
+    offset = _BIN_HEADER.size
+    pack_len = _BIN_STRLEN.pack_into
+    for (name, exhaust_id, sound_id), fixed in records:
+        pack_len(buf, offset, len(name))
+        offset += _BIN_STRLEN.size
+        buf[offset:offset + len(name)] = name
+        offset += len(name)
+        _BIN_FIXED.pack_into(buf, offset, *fixed)
+        offset += _BIN_FIXED.size
+        for b in (exhaust_id, sound_id):
+            pack_len(buf, offset, len(b))
+            offset += _BIN_STRLEN.size
+            buf[offset:offset + len(b)] = b
+            offset += len(b)
+    return bytes(buf)
 
 def meta_dict_to_xml_str(meta_dict):
+    SubElement = ET.SubElement
     root = ET.Element('metadata')
     for k, v in meta_dict.items():
         if isinstance(v, (list, tuple)):
-            sub = ET.SubElement(root, k)
+            sub = SubElement(root, k)
             for item in v:
-                ET.SubElement(sub, 'item').text = str(item)
+                SubElement(sub, 'item').text = str(item)
         else:
-            ET.SubElement(root, k).text = str(v)
-    return ET.tostring(root, encoding='utf-8').decode('utf-8')
+            SubElement(root, k).text = str(v)
+    # Serialize straight to str; no intermediate bytes + decode copy
+    return ET.tostring(root, encoding='unicode')
+
+_BOOL_TEXT = {'true': True, 'True': True, 'false': False, 'False': False}
+
+def _parse_scalar(t):
+    """Infer int/float/bool from an element's text, falling back to the string itself."""
+    if t is None:
+        return None
+    if '.' in t:
+        try:
+            return float(t)
+        except ValueError:
+            return t
+    digits = t[1:] if t[:1] in ('-', '+') else t
+    if digits.isdecimal():
+        return int(t)
+    return _BOOL_TEXT.get(t, t)
+
+def _parse_text(t):
+    return t
+
+def _parse_float(t):
+    """float(t); raises ValueError for missing or non-numeric text such as 'None'."""
+    if t is None:
+        raise ValueError("missing numeric value")
+    return float(t)
+
+def _parse_bool(t):
+    return _BOOL_TEXT.get(t)
+
+# Value types of the keys written by meta_dict_to_xml_str (see the bake operators).
+# List-valued keys map to the type of their items. Unknown tags fall back to _parse_scalar.
+_META_SCHEMA = {
+    'name': _parse_text,
+    'volumetric_exhaust_id': _parse_text,
+    'sound_event_on': _parse_text,
+    'sound_event_action_on': _parse_text,
+    'thrust_n': _parse_float,
+    'thrust_kn': _parse_float,
+    'specific_impulse_seconds': _parse_float,
+    'minimum_pulse_time_seconds': _parse_float,
+    'minimum_throttle': _parse_float,
+    'exportable': _parse_bool,
+    'location': _parse_float,
+    'rotation': _parse_float,
+    'fx_location': _parse_float,
+    'control_map_translation': _parse_bool,
+    'control_map_rotation': _parse_bool,
+}
+
+# Child tags of colour/vector elements, whose items are always floats
+_RGB_TAGS = frozenset(('r', 'g', 'b'))
+_XYZ_TAGS = frozenset(('x', 'y', 'z'))
 
 def _element_to_dict(elem):
     d = {}
+    schema_get = _META_SCHEMA.get
     for child in elem:
+        tag = child.tag
+        parse = schema_get(tag)
         if len(child):
-            tags = [c.tag for c in child]
             texts = [c.text for c in child]
-            if set(tags) <= {'r', 'g', 'b'}:
-                d[child.tag] = [float(t) for t in texts]
-            elif set(tags) <= {'x', 'y', 'z'}:
-                d[child.tag] = [float(t) for t in texts]
+            if parse is not None:
+                d[tag] = [parse(t) for t in texts]
+                continue
+            tags = {c.tag for c in child}
+            if tags <= _RGB_TAGS or tags <= _XYZ_TAGS:
+                d[tag] = [float(t) for t in texts]
             else:
-                vals = []
-                for t in texts:
-                    if t is None:
-                        vals.append(None)
-                    else:
-                        try:
-                            if '.' in t: vals.append(float(t))
-                            else: vals.append(int(t))
-                        except Exception:
-                            if t.lower() in ('true', 'false'): vals.append(t.lower() == 'true')
-                            else: vals.append(t)
-                d[child.tag] = vals
+                d[tag] = [_parse_scalar(t) for t in texts]
+        elif parse is None:
+            d[tag] = _parse_scalar(child.text)
         else:
-            t = child.text
-            if t is None:
-                d[child.tag] = None
-            else:
-                if t.lower() in ('true', 'false'):
-                    d[child.tag] = t.lower() == 'true'
-                else:
-                    try:
-                        if '.' in t: d[child.tag] = float(t)
-                        else: d[child.tag] = int(t)
-                    except Exception:
-                        d[child.tag] = t
+            d[tag] = parse(child.text)
     return d
 
-def parse_meta_string(s):
+def _parse_meta(s):
     if not s: return None
     s = s.strip()
     if s.startswith('<'):
         try:
             root = ET.fromstring(s)
-            if root.tag == 'thruster': return _element_to_dict(root)
+            if root.tag in ('thruster', 'metadata'): return _element_to_dict(root)
             if root.tag == 'thrusters': return [_element_to_dict(child) for child in root]
         except Exception:
             pass
@@ -196,16 +578,65 @@ def parse_meta_string(s):
     except Exception:
         return None
 
+# Kinds returned by parse_meta_string_typed
+META_NONE, META_DICT, META_LIST = 0, 1, 2
+
+@lru_cache(maxsize=4096)
+def _parse_meta_cached(s):
+    """(kind, payload) for ``s``; the kind is worked out once per distinct string."""
+    payload = _parse_meta(s)
+    if isinstance(payload, dict):
+        return META_DICT, payload
+    if isinstance(payload, list):
+        return META_LIST, payload
+    return META_NONE, payload
+
+def parse_meta_string_typed(s):
+    """Parse baked metadata (XML or JSON) into ``(kind, payload)``, where kind is
+    META_DICT, META_LIST or META_NONE (anything else, including parse failures).
+    Identical strings are parsed once; callers get their own copy of the payload."""
+    kind, payload = _parse_meta_cached(s)
+    return kind, copy.deepcopy(payload)
+
+
+@contextmanager
+def atomic_open(path, buffering=1 << 20):
+    """Open ``path`` for a binary export that replaces the file only once complete.
+
+    Data goes to ``path + '.tmp'`` and is fsynced and renamed over ``path`` when the
+    block exits normally, so a failed or interrupted export leaves the previous file
+    intact. On error the temporary file is removed and the exception re-raised.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb', buffering=buffering) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def xml_export_path(filepath: str) -> str:
+    """Output path of the XML list exporters: a legacy ``.json`` suffix becomes ``.xml``."""
+    if filepath[-5:].lower() == '.json':
+        return filepath[:-5] + '.xml'
+    return filepath
+
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9._-]')
 
 def sanitize_filename(name: str) -> str:
     """Sanitize object or image names for safe filesystem usage.
     Replaces disallowed characters with underscore and trims length. Guarantees non-empty.
     """
-    import re
     if not name:
         return "unnamed"
     # Replace path separators and any char not in whitelist with '_'
-    cleaned = re.sub(r'[^A-Za-z0-9._-]', '_', name)
+    cleaned = _UNSAFE_FILENAME_CHARS.sub('_', name)
     # Avoid leading dots (hidden files on some OS)
     cleaned = cleaned.lstrip('.')
     if not cleaned:
@@ -233,7 +664,7 @@ def _indent_xml(elem, level=0):
             elem[-1].tail = indent
     else:
         if not elem.text or not elem.text.strip():
-            elem.text = ''
+            elem.text = None
 
 
 def _extract_material_maps(mat):
@@ -255,6 +686,13 @@ def _extract_material_maps(mat):
         links = list(getattr(nt, 'links', []) or [])
         principled = [n for n in nodes if getattr(n, 'type', '') == 'BSDF_PRINCIPLED']
         normal_maps = [n for n in nodes if getattr(n, 'type', '') == 'NORMAL_MAP']
+        # Source nodes per destination socket, so a link lookup is one dict hit
+        links_by_to = {}
+        for link in links:
+            try:
+                links_by_to.setdefault(link.to_socket, []).append(link.from_node)
+            except Exception:
+                pass
         for node in nodes:
             if getattr(node, 'type', '') != 'TEX_IMAGE':
                 continue
@@ -271,10 +709,9 @@ def _extract_material_maps(mat):
                     for pnode in principled:
                         for inp in getattr(pnode, 'inputs', []) or []:
                             if getattr(inp, 'name', '').lower() in ['base color', 'basecolor']:
-                                for link in links:
-                                    if link.to_socket == inp and link.from_node == node:
-                                        result['diffuse'] = img
-                                        break
+                                if any(src == node for src in links_by_to.get(inp, ())):
+                                    result['diffuse'] = img
+                                    break
                         if 'diffuse' in result:
                             break
                 except Exception:
@@ -288,10 +725,9 @@ def _extract_material_maps(mat):
                     for nmap in normal_maps:
                         for inp in getattr(nmap, 'inputs', []) or []:
                             if getattr(inp, 'name', '').lower() in ['color', 'image']:
-                                for link in links:
-                                    if link.to_socket == inp and link.from_node == node:
-                                        result['normal'] = img
-                                        break
+                                if any(src == node for src in links_by_to.get(inp, ())):
+                                    result['normal'] = img
+                                    break
                         if 'normal' in result:
                             break
                 except Exception:
@@ -299,6 +735,8 @@ def _extract_material_maps(mat):
             # Rough/Metal/AO packed
             if 'roughmetaao' not in result and any(key in lower for key in ['rough', 'metal', 'ao', 'orm', 'rma']):
                 result['roughmetaao'] = img
+            if len(result) == 3:
+                break
         return result
     except Exception:
         return result